@@ -9,17 +9,26 @@ Interactive API docs (Swagger UI): /docs
 ReDoc: /redoc
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from fastapi import Body, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+from typing import Annotated, List, Optional
 
 from .scoring import score_prompt
 from .models import EvaluationResponse, Suggestion, QuizItem, QuizSubmission, QuizResult, ExampleItem
-from .quiz import get_quiz_items
+from .quiz import get_quiz_items_json, get_quiz_index
 from .config import load_config
-from .llm_eval import evaluate_with_ollama
-from .examples import load_examples
+from .llm_eval import aclose_client, evaluate_with_ollama, stream_evaluate
+from .examples import load_examples_snapshot
 
 
 tags_metadata = [
@@ -29,6 +38,37 @@ tags_metadata = [
     {"name": "Examples", "description": "Curated prompt examples with explanations."},
 ]
 
+
+class _SSEAwareGZipResponder(GZipResponder):
+    """GZip responder that passes `text/event-stream` bodies through uncompressed."""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                # Take starlette's pass-through path so each event is flushed as it is sent
+                self.content_encoding_set = True
+
+
+class SSEAwareGZipMiddleware(GZipMiddleware):
+    """`GZipMiddleware` that skips server-sent event streams (starlette 0.38 buffers them)."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _SSEAwareGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled keep-alive connections to Ollama
+    await aclose_client()
+
+
 app = FastAPI(
     title="Prompt Engineering Trainer",
     version="0.2.2",
@@ -43,16 +83,27 @@ app = FastAPI(
     },
     license_info={"name": "MIT"},
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
+    # orjson encodes response bodies much faster than the stdlib json default
+    default_response_class=ORJSONResponse,
 )
 CONFIG = load_config()
 
-# Allow local dev frontends
+# Upper bound on prompts accepted by /api/evaluate/batch
+MAX_BATCH_SIZE = 20
+
+# Compress JSON bodies (examples, quiz, evaluations); level 4 trades a little ratio for much less CPU.
+# Event streams are left uncompressed so SSE clients receive each event immediately.
+app.add_middleware(SSEAwareGZipMiddleware, minimum_size=500, compresslevel=4)
+
+# Allow local dev frontends. Credentials cannot be combined with a wildcard origin,
+# so they are only enabled when explicit origins are configured.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CONFIG.allowed_origins,
+    allow_credentials="*" not in CONFIG.allowed_origins,
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 
@@ -63,17 +114,18 @@ class EvaluateRequest(BaseModel):
     - goal: Optional intended use; currently unused by the UI but supported by the API.
     """
 
-    prompt: str
+    prompt: str = Field(min_length=1, max_length=4000, description="Question/prompt to evaluate (1–4000 characters).")
     goal: Optional[str] = None
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        json_schema_extra={
             "example": {
                 "prompt": "Explain the differences between SQL and NoSQL in 5 bullets for a beginner.",
                 "goal": None,
             }
-        }
-    }
+        },
+    )
 
 
 @app.get("/health", tags=["Health"], summary="Service health", description="Returns a simple OK status.")
@@ -89,23 +141,78 @@ def health():
     description=(
         "Scores question quality on four attributes (0–2 each), returns an overall score and label, "
         "actionable feedback, and an improved rewritten prompt. Uses Ollama if enabled; "
-        "falls back to a heuristic evaluator otherwise."
+        "falls back to a heuristic evaluator otherwise. Identical LLM evaluations are cached; "
+        "pass `nocache=true` to force a fresh one."
     ),
 )
-async def evaluate_prompt(body: EvaluateRequest):
-    # Basic validation to prevent empty or oversized prompts
-    if not body.prompt or not body.prompt.strip():
-        raise HTTPException(status_code=422, detail="Prompt cannot be empty. Please type your question.")
-    if len(body.prompt) > 4000:
-        raise HTTPException(status_code=422, detail="Prompt is too long (over 4000 characters). Please shorten it.")
-
+async def evaluate_prompt(body: EvaluateRequest, nocache: bool = False):
     # Try LLM-based evaluation if enabled; fall back to heuristic
-    llm_result = await evaluate_with_ollama(body.prompt, body.goal, CONFIG)
+    llm_result = await evaluate_with_ollama(body.prompt, body.goal, CONFIG, use_cache=not nocache)
     if llm_result is not None:
         return llm_result
     return score_prompt(body.prompt, body.goal)
 
 
+@app.post(
+    "/api/evaluate/stream",
+    response_class=StreamingResponse,
+    tags=["Evaluation"],
+    summary="Evaluate a question/prompt with streamed output",
+    description=(
+        "Server-sent events variant of `/api/evaluate`. Emits `token` events with raw model output "
+        "(`{\"text\": ...}`) as Ollama generates it, then one `result` event carrying the final "
+        "`EvaluationResponse`. If Ollama is disabled or fails, only the heuristic `result` is sent."
+    ),
+)
+async def evaluate_prompt_stream(body: EvaluateRequest):
+    async def events():
+        result = None
+        async for part in stream_evaluate(body.prompt, body.goal, CONFIG):
+            if isinstance(part, EvaluationResponse):
+                result = part
+            else:
+                yield _sse("token", json.dumps({"text": part}))
+        if result is None:
+            result = score_prompt(body.prompt, body.goal)
+        yield _sse("result", result.model_dump_json())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _sse(event: str, data: str) -> str:
+    """Format one server-sent event frame."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@app.post(
+    "/api/evaluate/batch",
+    response_model=List[EvaluationResponse],
+    tags=["Evaluation"],
+    summary="Evaluate several questions/prompts",
+    description=(
+        f"Evaluates up to {MAX_BATCH_SIZE} prompts concurrently and returns results in request order. "
+        "Each prompt uses Ollama if enabled and falls back to the heuristic evaluator on failure."
+    ),
+)
+async def evaluate_batch(body: Annotated[List[EvaluateRequest], Body(max_length=MAX_BATCH_SIZE)]):
+    results = await asyncio.gather(
+        *(evaluate_with_ollama(item.prompt, item.goal, CONFIG) for item in body),
+        return_exceptions=True,
+    )
+    results = list(results)
+    # Heuristic fallbacks for a whole batch add up; score them off the event loop
+    missing = [i for i, res in enumerate(results) if not isinstance(res, EvaluationResponse)]
+    if missing:
+        scored = await asyncio.to_thread(lambda: [score_prompt(body[i].prompt, body[i].goal) for i in missing])
+        for i, res in zip(missing, scored):
+            results[i] = res
+    return results
+
+
 @app.get(
     "/api/quiz",
     response_model=List[QuizItem],
@@ -114,8 +221,8 @@ async def evaluate_prompt(body: EvaluateRequest):
     description="Returns up to `limit` quiz items, sampled to ensure label balance where possible.",
 )
 def list_quiz_items(limit: int = 10):
-    items = get_quiz_items(limit)
-    return items
+    # Items are sampled per request, but each item's JSON is encoded once per file version
+    return Response(content=get_quiz_items_json(limit), media_type="application/json")
 
 
 @app.post(
@@ -129,7 +236,7 @@ def submit_quiz(submission: QuizSubmission):
     # Grade answers
     correct = 0
     details = []
-    items_by_id = {item.id: item for item in get_quiz_items(limit=1000)}
+    items_by_id = get_quiz_index()
     for answer in submission.answers:
         item = items_by_id.get(answer.item_id)
         if not item:
@@ -161,6 +268,20 @@ def submit_quiz(submission: QuizSubmission):
     summary="List curated examples",
     description="Returns BAD/OK/GOOD prompt examples with per-level explanations and detailed notes.",
 )
-def list_examples():
-    # Load from disk each request to reflect latest examples without restart
-    return load_examples()
+def list_examples(request: Request):
+    # Cached per file version; edits to examples.json are still picked up without restart.
+    # The body is pre-encoded, and clients holding the current ETag get a 304.
+    snapshot = load_examples_snapshot()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "public, max-age=60"}
+    if _etag_matches(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header covers `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags
@@ -1,7 +1,8 @@
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List
 
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "config.json"
@@ -18,6 +19,8 @@ class OllamaConfig:
 @dataclass
 class AppConfig:
     ollama: OllamaConfig
+    # Origins allowed by CORS; "*" keeps the file:// frontend working in local dev
+    allowed_origins: List[str] = field(default_factory=lambda: ["*"])
 
 
 def load_config() -> AppConfig:
@@ -29,12 +32,14 @@ def load_config() -> AppConfig:
         return AppConfig(ollama=OllamaConfig())
 
     ol = data.get("ollama", {}) if isinstance(data, dict) else {}
+    cors = data.get("cors", {}) if isinstance(data, dict) else {}
+    origins = cors.get("allowed_origins", ["*"]) if isinstance(cors, dict) else ["*"]
     return AppConfig(
         ollama=OllamaConfig(
             enabled=bool(ol.get("enabled", False)),
             base_url=str(ol.get("base_url", "http://localhost:11434")),
             model=str(ol.get("model", "llama3.1")),
             timeout_sec=int(ol.get("timeout_sec", 20)),
-        )
+        ),
+        allowed_origins=[str(o) for o in origins],
     )
-
@@ -1,32 +1,67 @@
 """Helpers to load curated BAD/OK/GOOD examples from JSON."""
 
-import json
 import random
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+from pydantic import TypeAdapter
+
+from .filecache import FileCache, Version
 from .models import ExampleItem
 
 
 DATA_PATH = Path(__file__).parent / "data" / "examples.json"
 
 
+@dataclass(frozen=True)
+class ExamplesSnapshot:
+    """Parsed examples for one version of the file plus its pre-encoded JSON body."""
+
+    items: List[ExampleItem]
+    etag: str
+    body: bytes
+
+
+_ITEMS_ADAPTER = TypeAdapter(List[ExampleItem])
+
+
+def _build_snapshot(data: bytes, version: Version) -> ExamplesSnapshot:
+    items = _ITEMS_ADAPTER.validate_json(data)
+    return ExamplesSnapshot(
+        items=items,
+        etag=f'W/"{version[0]}-{version[1]}"',
+        body=_ITEMS_ADAPTER.dump_json(items),
+    )
+
+
+_SNAPSHOT = FileCache(DATA_PATH, _build_snapshot)
+
+
+def load_examples_snapshot() -> ExamplesSnapshot:
+    """Return the cached examples snapshot, reparsing only when the file changes.
+
+    Raises `pydantic.ValidationError` if the file is malformed.
+    """
+    return _SNAPSHOT.get()
+
+
 def load_examples() -> List[ExampleItem]:
     """Load the examples JSON file and parse into `ExampleItem` objects.
 
-    Raises `json.JSONDecodeError` if the file is malformed.
+    The parsed list is cached and only rebuilt when the file's mtime or size
+    changes, so edits are still picked up without a restart.
+
+    Raises `pydantic.ValidationError` if the file is malformed.
     """
-    with DATA_PATH.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [ExampleItem(**row) for row in data]
+    return load_examples_snapshot().items
 
 
 def get_random_example(examples: List[ExampleItem]) -> ExampleItem:
     """Pick a random example from a preloaded list."""
-    return random.choice(examples) if examples else ExampleItem(
+    return random.choice(examples) if examples else ExampleItem.model_construct(
         id="empty",
         bad="",
         ok="",
         good="",
-        explanation="",
     )
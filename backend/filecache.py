@@ -0,0 +1,39 @@
+"""Memoize a value derived from a data file until the file changes on disk."""
+
+import threading
+from pathlib import Path
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+# (st_mtime_ns, st_size) of the file a cached value was built from
+Version = Tuple[int, int]
+
+
+class FileCache(Generic[T]):
+    """Hold the value built from `path`, rebuilding it when the file's mtime or size changes.
+
+    `build` receives the raw file bytes and the file version they were read at.
+    Exceptions from `build` propagate and leave the previous value in place.
+    """
+
+    def __init__(self, path: Path, build: Callable[[bytes, Version], T]) -> None:
+        self.path = path
+        self._build = build
+        self._slot: Optional[Tuple[Version, T]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        st = self.path.stat()
+        version = (st.st_mtime_ns, st.st_size)
+        slot = self._slot
+        if slot is not None and slot[0] == version:
+            return slot[1]
+        with self._lock:
+            slot = self._slot
+            if slot is not None and slot[0] == version:
+                return slot[1]
+            value = self._build(self.path.read_bytes(), version)
+            self._slot = (version, value)
+            return value
@@ -6,8 +6,12 @@ an improved prompt. If the request fails or the response cannot be parsed,
 the caller should fall back to the heuristic evaluator.
 """
 
+import asyncio
+import hashlib
 import json
-from typing import Any, Dict, Optional
+import os
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
 import httpx
 
@@ -15,6 +19,43 @@ from .config import AppConfig
 from .models import EvaluationResponse
 
 
+# Caps concurrent generations; matches Ollama's own OLLAMA_NUM_PARALLEL setting
+_OLLAMA_SEM = asyncio.Semaphore(int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+# Bump when SYSTEM_RUBRIC changes so cached evaluations are not reused across rubrics
+RUBRIC_VERSION = "1"
+
+# Bounded LRU of successful evaluations keyed by (model, rubric, goal, prompt)
+_LLM_CACHE: "OrderedDict[bytes, EvaluationResponse]" = OrderedDict()
+_LLM_CACHE_SIZE = 1024
+
+# Generations in progress, so identical concurrent requests await one result
+_INFLIGHT: Dict[bytes, "asyncio.Future[Optional[EvaluationResponse]]"] = {}
+
+# Shared client so repeated evaluations reuse keep-alive connections to Ollama
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _client(cfg: AppConfig) -> httpx.AsyncClient:
+    """Return the shared Ollama client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            base_url=cfg.ollama.base_url.rstrip("/"),
+            timeout=cfg.ollama.timeout_sec,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _CLIENT
+
+
+async def aclose_client() -> None:
+    """Close the shared Ollama client; called on application shutdown."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
 SYSTEM_RUBRIC = (
     "You are an expert evaluator of question quality for eliciting useful LLM answers. "
     "Rate exactly these 4 attributes, each as 0=needs work, 1=okay, 2=strong: "
@@ -26,44 +67,95 @@ SYSTEM_RUBRIC = (
 )
 
 
-def _build_user_prompt(prompt: str, goal: Optional[str]) -> str:
-    return (
-        "Evaluate and improve the QUESTION below using the 4-attribute rubric.\n\n"
-        f"Question:\n{prompt}\n\n"
-        f"Intended goal/use (optional): {goal or 'None'}\n\n"
-        "Provide concise feedback and suggestions, and return a single rewritten improved question in improved_prompt."
-    )
+def _cache_key(prompt: str, goal: Optional[str], cfg: AppConfig) -> bytes:
+    raw = repr((cfg.ollama.model, RUBRIC_VERSION, goal, prompt)).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
 
 
-async def evaluate_with_ollama(prompt: str, goal: Optional[str], cfg: AppConfig) -> Optional[EvaluationResponse]:
+# Fixed parts of the generation prompt, concatenated once at import
+_PROMPT_PREFIX = (
+    SYSTEM_RUBRIC + "\n\n"
+    "Evaluate and improve the QUESTION below using the 4-attribute rubric.\n\n"
+    "Question:\n"
+)
+_PROMPT_MID = "\n\nIntended goal/use (optional): "
+_PROMPT_SUFFIX = (
+    "\n\n"
+    "Provide concise feedback and suggestions, and return a single rewritten improved question in improved_prompt."
+)
+
+# Request fields that do not vary per call
+_PAYLOAD_TEMPLATE: Dict[str, Any] = {
+    "format": "json",
+    # Keep the model loaded between calls instead of reloading it each time
+    "keep_alive": "10m",
+    "options": {"temperature": 0.2},
+}
+
+
+def _build_prompt(prompt: str, goal: Optional[str]) -> str:
+    return "".join((_PROMPT_PREFIX, prompt, _PROMPT_MID, goal or "None", _PROMPT_SUFFIX))
+
+
+async def evaluate_with_ollama(
+    prompt: str, goal: Optional[str], cfg: AppConfig, use_cache: bool = True
+) -> Optional[EvaluationResponse]:
     """Evaluate using Ollama if enabled in config.
 
+    Successful evaluations are memoized in a bounded LRU, and concurrent calls
+    for the same key share a single generation. Pass `use_cache=False` to force
+    a fresh generation (the result still refreshes the cache).
+
     Returns `None` if disabled, request fails, or the response cannot be parsed
     into `EvaluationResponse`.
     """
     if not cfg.ollama.enabled:
         return None
 
-    url = cfg.ollama.base_url.rstrip("/") + "/api/generate"
-    headers = {"Content-Type": "application/json"}
-    payload: Dict[str, Any] = {
+    key = _cache_key(prompt, goal, cfg)
+    if use_cache:
+        cached = _LLM_CACHE.get(key)
+        if cached is not None:
+            _LLM_CACHE.move_to_end(key)
+            return cached
+        pending = _INFLIGHT.get(key)
+        if pending is not None:
+            # Shield so a disconnecting follower does not cancel the shared future
+            return await asyncio.shield(pending)
+
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT.setdefault(key, fut)
+    result = None
+    try:
+        result = await _generate(prompt, goal, cfg)
+        if result is not None:
+            _remember(key, result)
+    finally:
+        if _INFLIGHT.get(key) is fut:
+            del _INFLIGHT[key]
+        # Followers fall back to the heuristic if this generation failed or was cancelled
+        fut.set_result(result)
+    return result
+
+
+def _payload(prompt: str, goal: Optional[str], cfg: AppConfig, stream: bool) -> Dict[str, Any]:
+    return {
+        **_PAYLOAD_TEMPLATE,
         "model": cfg.ollama.model,
-        "prompt": SYSTEM_RUBRIC + "\n\n" + _build_user_prompt(prompt, goal),
-        "format": "json",
-        "stream": False,
-        "options": {"temperature": 0.2},
+        "prompt": _build_prompt(prompt, goal),
+        "stream": stream,
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=cfg.ollama.timeout_sec) as client:
-            resp = await client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-    except Exception:
-        return None
 
-    # Ollama returns { response: "...json...", ... }
-    text = data.get("response") if isinstance(data, dict) else None
+def _remember(key: bytes, result: EvaluationResponse) -> None:
+    _LLM_CACHE[key] = result
+    _LLM_CACHE.move_to_end(key)
+    if len(_LLM_CACHE) > _LLM_CACHE_SIZE:
+        _LLM_CACHE.popitem(last=False)
+
+
+def _parse_evaluation(text: Optional[str]) -> Optional[EvaluationResponse]:
+    """Parse the model's JSON text into `EvaluationResponse`, or `None` if invalid."""
     if not text:
         return None
     try:
@@ -73,14 +165,76 @@ async def evaluate_with_ollama(prompt: str, goal: Optional[str], cfg: AppConfig)
 
     try:
         # Validate/normalize into our model
-        return EvaluationResponse(
-            label=str(obj.get("label", "ok")).lower(),
-            score=int(obj.get("score", 60)),
-            summary=obj.get("summary", ""),
-            subscores=obj.get("subscores", []),
-            feedback=obj.get("feedback", []),
-            suggestions=obj.get("suggestions", []),
-            improved_prompt=obj.get("improved_prompt"),
-        )
+        return EvaluationResponse.model_validate({
+            "label": str(obj.get("label", "ok")).lower(),
+            "score": int(obj.get("score", 60)),
+            "summary": obj.get("summary", ""),
+            "subscores": obj.get("subscores", []),
+            "feedback": obj.get("feedback", []),
+            "suggestions": obj.get("suggestions", []),
+            "improved_prompt": obj.get("improved_prompt"),
+        })
     except Exception:
         return None
+
+
+async def _generate(prompt: str, goal: Optional[str], cfg: AppConfig) -> Optional[EvaluationResponse]:
+    """Run one Ollama generation and parse it into `EvaluationResponse`."""
+    try:
+        async with _OLLAMA_SEM:
+            resp = await _client(cfg).post("/api/generate", json=_payload(prompt, goal, cfg, stream=False))
+        resp.raise_for_status()
+        data = resp.json()
+    except Exception:
+        return None
+
+    # Ollama returns { response: "...json...", ... }
+    text = data.get("response") if isinstance(data, dict) else None
+    return _parse_evaluation(text)
+
+
+async def stream_evaluate(
+    prompt: str, goal: Optional[str], cfg: AppConfig
+) -> AsyncIterator[Union[str, EvaluationResponse]]:
+    """Stream an Ollama evaluation as it is generated.
+
+    Yields raw text fragments as they arrive, then the parsed
+    `EvaluationResponse` as the last item. Yields no result if Ollama is
+    disabled, the request fails, or the output cannot be parsed; the caller
+    should then fall back to the heuristic evaluator. Cached results are
+    yielded immediately without contacting Ollama.
+    """
+    if not cfg.ollama.enabled:
+        return
+
+    key = _cache_key(prompt, goal, cfg)
+    cached = _LLM_CACHE.get(key)
+    if cached is not None:
+        _LLM_CACHE.move_to_end(key)
+        yield cached
+        return
+
+    parts = []
+    try:
+        async with _OLLAMA_SEM:
+            payload = _payload(prompt, goal, cfg, stream=True)
+            async with _client(cfg).stream("POST", "/api/generate", json=payload) as resp:
+                resp.raise_for_status()
+                # Ollama streams NDJSON: one { response: "...", done: bool } object per line
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    fragment = chunk.get("response") if isinstance(chunk, dict) else None
+                    if fragment:
+                        parts.append(fragment)
+                        yield fragment
+                    if isinstance(chunk, dict) and chunk.get("done"):
+                        break
+    except Exception:
+        return
+
+    result = _parse_evaluation("".join(parts))
+    if result is not None:
+        _remember(key, result)
+        yield result
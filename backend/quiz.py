@@ -1,24 +1,64 @@
 """Quiz item loader and sampler with basic stratification by label."""
 
-import json
 import random
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
+from pydantic import TypeAdapter
+
+from .filecache import FileCache, Version
 from .models import QuizItem
 
 
 DATA_PATH = Path(__file__).parent / "data" / "quiz.json"
 
+# Dedicated generator for quiz sampling, independent of the global `random` state
+_RNG = random.Random()
+
+_ITEMS_ADAPTER = TypeAdapter(List[QuizItem])
+
+
+@dataclass(frozen=True)
+class _Corpus:
+    """All quiz items for one version of the file, plus lookups derived from them."""
+
+    items: List[QuizItem]
+    by_id: Dict[str, QuizItem]
+    # label -> indices into `items`, for stratified sampling
+    by_label: Dict[str, List[int]]
+    # item JSON aligned with `items`, encoded once so responses can be assembled from bytes
+    encoded: List[bytes]
+
+
+def _build_corpus(data: bytes, version: Version) -> _Corpus:
+    items = _ITEMS_ADAPTER.validate_json(data)
+    by_label: Dict[str, List[int]] = {"bad": [], "ok": [], "good": []}
+    for i, item in enumerate(items):
+        if item.label in by_label:
+            by_label[item.label].append(i)
+    return _Corpus(
+        items=items,
+        by_id={item.id: item for item in items},
+        by_label=by_label,
+        encoded=[item.model_dump_json().encode("utf-8") for item in items],
+    )
+
+
+_CORPUS = FileCache(DATA_PATH, _build_corpus)
+
 
-def _load_all() -> List[QuizItem]:
-    """Load all quiz items from disk.
+def _load_corpus() -> _Corpus:
+    """Return the cached corpus, reparsing only when the file changes.
 
-    Raises `json.JSONDecodeError` if the file is malformed.
+    Raises `pydantic.ValidationError` if the file is malformed.
     """
-    with DATA_PATH.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [QuizItem(**row) for row in data]
+    return _CORPUS.get()
+
+
+def get_quiz_index() -> Dict[str, QuizItem]:
+    """Return all quiz items keyed by id, rebuilt only when the file changes."""
+    return _load_corpus().by_id
 
 
 def get_quiz_items(limit: int = 10) -> List[QuizItem]:
@@ -26,30 +66,43 @@ def get_quiz_items(limit: int = 10) -> List[QuizItem]:
 
     Falls back to random sampling for remaining slots.
     """
-    items = _load_all()
+    corpus = _load_corpus()
+    return [corpus.items[i] for i in _sample_indices(corpus, limit)]
+
+
+def get_quiz_items_json(limit: int = 10) -> bytes:
+    """Like `get_quiz_items`, but return the sampled items as a JSON array.
+
+    Sampling and encoding use the same corpus snapshot, so each item's JSON
+    encoded at load time is reused as-is.
+    """
+    corpus = _load_corpus()
+    return b"[" + b",".join(corpus.encoded[i] for i in _sample_indices(corpus, limit)) + b"]"
+
+
+def _sample_indices(corpus: _Corpus, limit: int) -> List[int]:
+    """Pick up to `limit` indices into `corpus.items`, stratified by label."""
+    items = corpus.items
     if not items:
         return []
 
     k = min(limit, len(items))
 
-    # Ensure at least 2 of each label (bad/ok/good) when possible
-    buckets = {"bad": [], "ok": [], "good": []}
-    for it in items:
-        if it.label in buckets:
-            buckets[it.label].append(it)
-
-    chosen: List[QuizItem] = []
+    # Ensure at least 2 of each label (bad/ok/good) when possible. Sampling works on
+    # the corpus' precomputed per-label indices, so models are never copied or compared.
+    picked: List[int] = []
     needed_per_label = 2 if k >= 6 else 1
-    for label, bucket in buckets.items():
+    for label, bucket in corpus.by_label.items():
         take = min(needed_per_label, len(bucket))
         if take > 0:
-            chosen.extend(random.sample(bucket, take))
+            picked.extend(_RNG.sample(bucket, take))
 
     # Fill remaining slots randomly from the rest
-    remaining = [it for it in items if it not in chosen]
-    remaining_slots = k - len(chosen)
+    picked_set = set(picked)
+    remaining = [i for i in range(len(items)) if i not in picked_set]
+    remaining_slots = k - len(picked)
     if remaining_slots > 0 and remaining:
-        chosen.extend(random.sample(remaining, min(remaining_slots, len(remaining))))
+        picked.extend(_RNG.sample(remaining, min(remaining_slots, len(remaining))))
 
-    random.shuffle(chosen)
-    return chosen[:k]
+    _RNG.shuffle(picked)
+    return picked[:k]
@@ -1,5 +1,7 @@
+import functools
 import re
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Tuple
 
 from .models import EvaluationResponse, Subscore, Suggestion
 
@@ -15,31 +17,94 @@ from .models import EvaluationResponse, Subscore, Suggestion
 # Overall score = sum(attributes) * 12.5 → 0..100, then label good/ok/bad.
 question_words = ["who", "what", "when", "where", "why", "how", "which"]
 
+# Patterns compiled once at import; the scorers below run on every evaluation.
+# Keyword patterns are lowercase and run on a lowercased copy of the prompt instead of using re.I.
+_QWORD_RE = re.compile(r"\b(?:" + "|".join(question_words) + r")\b")
+_SPEC_NUM_RE = re.compile(r"\b(\d+|top \d+|in \d+ (words|bullets))\b")
+_SPEC_AUDIENCE_RE = re.compile(r"\b(for|about|regarding|focused on|for (beginners|executives|students))\b")
+_SPEC_TIME_RE = re.compile(r"\b(week|month|30 days|deadline)\b")
+_URL_RE = re.compile(r"https?://\S+")
+_INLINE_CODE_RE = re.compile(r"`[^`]{10,}`")
+_STRUCTURED_RE = re.compile(r"\{[^\}]{10,}\}|\[[^\]]{10,}\]")
+_LIST_RE = re.compile(r"(^\s*[-*]\s+|^\s*\d+\.\s+)", re.M)
+# Length, structure and tone cues in one pattern. The length unit is a lookahead so a
+# word like "bullets" in "in 5 bullets" still counts as a structure cue too. The shared
+# \b and first-letter lookahead let the scan skip most positions without trying each branch.
+_FORMAT_RE = re.compile(
+    r"\b(?=[bfijlmst])(?:"
+    r"(?P<length>in \d+ (?=(?:words|sentences|bullets|lines)\b))"
+    r"|(?P<kind>(?:json|table|markdown|bullets?|schema|format)\b)"
+    r"|(?P<tone>(?:tone|style|level)\b)"
+    r")"
+)
+
+
+@dataclass(slots=True)
+class Features:
+    """Signals extracted from the prompt in one pass and shared by all scorers."""
+
+    word_count: int
+    digit_count: int
+    has_qmark: bool
+    has_qword: bool
+    has_spec_number: bool
+    has_spec_audience: bool
+    has_spec_timeframe: bool
+    has_url: bool
+    has_code: bool
+    has_structured: bool
+    has_list: bool
+    format_signals: int
+
+
+def _extract_features(text: str) -> Features:
+    """Scan `text` once for every signal the subscorers need."""
+    lower = text.lower()
+    if len(lower) != len(text):
+        # Only "İ" lowercases to two code points; map it to "i" so word boundaries stay aligned
+        lower = text.replace("\u0130", "i").lower()
+    return Features(
+        word_count=len(text.split()),
+        # str.isdecimal matches exactly what \d matches, without building a list of matches
+        digit_count=sum(map(str.isdecimal, text)),
+        has_qmark="?" in text,
+        has_qword=bool(_QWORD_RE.search(lower)),
+        has_spec_number=bool(_SPEC_NUM_RE.search(lower)),
+        has_spec_audience=bool(_SPEC_AUDIENCE_RE.search(lower)),
+        has_spec_timeframe=bool(_SPEC_TIME_RE.search(lower)),
+        has_url=bool(_URL_RE.search(text)),
+        has_code=("```" in text) or bool(_INLINE_CODE_RE.search(text)),
+        has_structured=bool(_STRUCTURED_RE.search(text)),
+        has_list=bool(_LIST_RE.search(text)),
+        format_signals=_count_format_signals(lower),
+    )
+
+
+def _count_format_signals(lower: str) -> int:
+    """Count distinct format cue kinds (length/structure/tone) in a single scan."""
+    found = set()
+    for m in _FORMAT_RE.finditer(lower):
+        found.add(m.lastgroup)
+        if len(found) == 3:
+            break
+    return len(found)
+
 
-def _clarity(text: str) -> Tuple[int, str]:
+def _clarity(f: Features) -> Tuple[int, str]:
     """Score clarity: 0=needs work, 1=okay, 2=strong.
 
     Signals: presence of a question mark and question words, and a minimal length to avoid telegraphic asks.
     """
-    has_qmark = "?" in text
-    has_qword = any(re.search(fr"\b{w}\b", text, re.I) for w in question_words)
-    words = len(text.split())
-    if has_qmark and has_qword and words >= 6:
+    if f.has_qmark and f.has_qword and f.word_count >= 6:
         return 2, "Single, direct question"
-    if has_qmark or has_qword:
+    if f.has_qmark or f.has_qword:
         return 1, "Somewhat direct"
     return 0, "Ask one clear question."
 
 
-def _specificity(text: str) -> Tuple[int, str]:
+def _specificity(f: Features) -> Tuple[int, str]:
     """Score specificity: 0/1/2 based on scope-narrowing cues."""
-    hits = 0
-    if re.search(r"\b(\d+|top \d+|in \d+ (words|bullets))\b", text, re.I):
-        hits += 1
-    if re.search(r"\b(for|about|regarding|focused on|for (beginners|executives|students))\b", text, re.I):
-        hits += 1
-    if re.search(r"\b(week|month|30 days|deadline)\b", text, re.I):
-        hits += 1
+    hits = f.has_spec_number + f.has_spec_audience + f.has_spec_timeframe
     if hits >= 2:
         return 2, "Specific scope"
     if hits == 1:
@@ -47,40 +112,27 @@ def _specificity(text: str) -> Tuple[int, str]:
     return 0, "Add topic/audience/numbers."
 
 
-def _context(text: str) -> Tuple[int, str]:
+def _context(f: Features) -> Tuple[int, str]:
     """Score context using content signals rather than explicit marker words.
 
     Considers URLs, code blocks/inline code, structured data, and lists/numerical density.
     """
     # Score context based on content signals, not explicit markers
-    has_url = bool(re.search(r"https?://\S+", text))
-    has_code_like = ("```" in text) or bool(re.search(r"`[^`]{10,}`", text))
-    has_structured = bool(re.search(r"\{[^\}]{10,}\}|\[[^\]]{10,}\]", text))
-    has_list = bool(re.search(r"(^\s*[-*]\s+|^\s*\d+\.\s+)", text, re.M))
-    digits = len(re.findall(r"\d", text))
-    has_numbers = digits >= 3
-    word_count = len(text.split())
-
-    strong_signals = sum([has_url, has_code_like, has_structured, has_list, has_numbers])
+    has_numbers = f.digit_count >= 3
+    strong_signals = f.has_url + f.has_code + f.has_structured + f.has_list + has_numbers
     if strong_signals >= 2:
         return 2, "Includes usable context"
-    if strong_signals >= 1 or word_count > 40:
+    if strong_signals >= 1 or f.word_count > 40:
         return 1, "Some context present"
     return 0, "Add essential background or inputs."
 
 
-def _format(text: str) -> Tuple[int, str]:
+def _format(f: Features) -> Tuple[int, str]:
     """Score constraints & format: look for length, structure, tone/level.
 
     Two or more signals → strong (2); one signal → okay (1); none → needs work (0).
     """
-    hits = 0
-    if re.search(r"\b(in \d+ (words|sentences|bullets|lines))\b", text, re.I):
-        hits += 1
-    if re.search(r"\b(json|table|markdown|bullets?|schema|format)\b", text, re.I):
-        hits += 1
-    if re.search(r"\b(tone|style|level)\b", text, re.I):
-        hits += 1
+    hits = f.format_signals
     if hits >= 2:
         return 2, "Clear format/length"
     if hits == 1:
@@ -96,18 +148,24 @@ def _label_from_score(score: int) -> str:
     return "bad"
 
 
+@functools.lru_cache(maxsize=4096)
+def _score_core(text: str) -> Tuple[Tuple[str, int, str], ...]:
+    """Return (name, score, comment) per attribute; memoized since it is pure in `text`."""
+    feats = _extract_features(text)
+    return (
+        ("Clarity",) + _clarity(feats),
+        ("Specificity",) + _specificity(feats),
+        ("Context",) + _context(feats),
+        ("Constraints & Format",) + _format(feats),
+    )
+
+
 def score_prompt(prompt: str, goal: Optional[str] = None) -> EvaluationResponse:
     """Evaluate a question/prompt and return a structured `EvaluationResponse`.
 
     Heuristic-only; the API endpoint may use the LLM-backed evaluator first.
     """
-    text = prompt.strip()
-    core: List[Tuple[str, int, str]] = [
-        ("Clarity",) + _clarity(text),
-        ("Specificity",) + _specificity(text),
-        ("Context",) + _context(text),
-        ("Constraints & Format",) + _format(text),
-    ]
+    core = _score_core(prompt.strip())
 
     # 0–8 mapped to 0–100
     raw = sum(s for _, s, _ in core)
@@ -118,20 +176,21 @@ def score_prompt(prompt: str, goal: Optional[str] = None) -> EvaluationResponse:
     weakest = sorted(core, key=lambda t: t[1])[:3]
     feedback = [f"{n}: {c}" for n, s, c in weakest if s < 2]
 
+    sub_scores = {n: s for n, s, _ in core}
     suggestions: List[Suggestion] = []
-    for n, s, _ in core:
-        if n == "Clarity" and s < 2:
-            suggestions.append(Suggestion(title="Ask one question", text="Start with 'How/What/Why ...?'"))
-        if n == "Specificity" and s < 2:
-            suggestions.append(Suggestion(title="Be specific", text="Add audience/topic and numbers (e.g., 'top 3')."))
-        if n == "Context" and s < 2:
-            suggestions.append(Suggestion(title="Add context", text="Include the key background/input needed."))
-        if n == "Constraints & Format" and s < 2:
-            suggestions.append(Suggestion(title="Set format", text="Ask for bullets/table/JSON and a word limit."))
-
-    improved = build_improved_prompt(prompt, goal, core)
-
-    subscores = [Subscore(name=n, score=s, comment=c) for n, s, c in core]
+    if sub_scores["Clarity"] < 2:
+        suggestions.append(Suggestion.model_construct(title="Ask one question", text="Start with 'How/What/Why ...?'"))
+    if sub_scores["Specificity"] < 2:
+        suggestions.append(Suggestion.model_construct(title="Be specific", text="Add audience/topic and numbers (e.g., 'top 3')."))
+    if sub_scores["Context"] < 2:
+        suggestions.append(Suggestion.model_construct(title="Add context", text="Include the key background/input needed."))
+    if sub_scores["Constraints & Format"] < 2:
+        suggestions.append(Suggestion.model_construct(title="Set format", text="Ask for bullets/table/JSON and a word limit."))
+
+    improved = build_improved_prompt(prompt, goal, sub_scores)
+
+    # Built from our own type-correct values, so skip pydantic validation
+    subscores = [Subscore.model_construct(name=n, score=s, comment=c) for n, s, c in core]
     summary = (
         "Strong question—clear, specific, and easy to answer."
         if label == "good" else
@@ -140,7 +199,7 @@ def score_prompt(prompt: str, goal: Optional[str] = None) -> EvaluationResponse:
         "Vague question—clarify ask, add context, set format."
     )
 
-    return EvaluationResponse(
+    return EvaluationResponse.model_construct(
         label=label,
         score=score,
         summary=summary,
@@ -151,15 +210,15 @@ def score_prompt(prompt: str, goal: Optional[str] = None) -> EvaluationResponse:
     )
 
 
-def build_improved_prompt(prompt: str, goal: Optional[str], subs: List[Tuple[str, int, str]]) -> str:
+def build_improved_prompt(prompt: str, goal: Optional[str], sub_scores: Mapping[str, int]) -> str:
     """Return a single rewritten question/instruction that addresses detected weaknesses.
 
     Avoids meta-text; adds short specificity/format cues when missing.
     """
     # Produce a single, rewritten question/instruction (no meta text)
-    needs_format = next((s for n, s, _ in subs if n == "Constraints & Format"), 0) <= 1
-    needs_specificity = next((s for n, s, _ in subs if n == "Specificity"), 0) <= 1
-    needs_context = next((s for n, s, _ in subs if n == "Context"), 0) <= 1
+    needs_format = sub_scores.get("Constraints & Format", 0) <= 1
+    needs_specificity = sub_scores.get("Specificity", 0) <= 1
+    needs_context = sub_scores.get("Context", 0) <= 1
 
     base = " ".join((prompt or "").strip().split())
     if not base:
@@ -179,5 +238,5 @@ def build_improved_prompt(prompt: str, goal: Optional[str], subs: List[Tuple[str
 
     if tail:
         sep = " " if base.endswith(('.', '?')) else ". "
-        base = base + sep + " ".join(tail)
+        base = f"{base}{sep}{' '.join(tail)}"
     return base